@@ -16,6 +16,9 @@ from sunpy.map.sources.source_type import source_stretch
 
 __all__ = ['AIAMap', 'HMIMap']
 
+# Stretches are stateless, so a single instance can be shared by every map.
+_ASINH_001 = AsinhStretch(0.01)
+
 
 class AIAMap(GenericMap):
     """AIA Image Map.
@@ -46,6 +49,8 @@ class AIAMap(GenericMap):
     * `Instrument Paper <https://doi.org/10.1007/s11207-011-9776-8>`_
     * `wavelengths and temperature response reference <https://www.lmsal.com/sdodocs/doc/dcur/SDOD0060.zip/zip/entry/figures/aia_tel_resp.png>`_
     """
+    # Default color map names keyed on the metadata they are built from.
+    _cmap_cache = {}
 
     def __init__(self, data, header, **kwargs):
         GenericMap.__init__(self, data, header, **kwargs)
@@ -53,8 +58,14 @@ class AIAMap(GenericMap):
         # Fill in some missing info
         self.meta['detector'] = self.meta.get('detector', "AIA")
         self._nickname = self.detector
-        self.plot_settings['cmap'] = self._get_cmap_name()
-        self.plot_settings['norm'] = ImageNormalize(stretch=source_stretch(self.meta, AsinhStretch(0.01)), clip=False)
+        cmap_key = (self.observatory, self.detector,
+                    self.meta.get('wavelnth', 0), self.meta.get('waveunit'))
+        if cmap_key not in self._cmap_cache:
+            self._cmap_cache[cmap_key] = self._get_cmap_name()
+        self.plot_settings['cmap'] = self._cmap_cache[cmap_key]
+        # Norms carry mutable state such as vmin and vmax, so unlike the stretch
+        # each map needs its own instance.
+        self.plot_settings['norm'] = ImageNormalize(stretch=source_stretch(self.meta, _ASINH_001), clip=False)
 
     @property
     def _supported_observer_coordinates(self):
@@ -76,7 +87,7 @@ class AIAMap(GenericMap):
     @classmethod
     def is_datasource_for(cls, data, header, **kwargs):
         """Determines if header corresponds to an AIA image"""
-        return header.get('instrume', '').startswith('AIA')
+        return header.get('instrume', '')[:3] == 'AIA'
 
 
 class HMIMap(GenericMap):
@@ -121,4 +132,4 @@ class HMIMap(GenericMap):
     @classmethod
     def is_datasource_for(cls, data, header, **kwargs):
         """Determines if header corresponds to an HMI image"""
-        return header.get('instrume', '').startswith('HMI')
+        return header.get('instrume', '')[:3] == 'HMI'
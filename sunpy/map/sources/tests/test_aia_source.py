@@ -53,3 +53,9 @@ def test_measurement(createAIAMap):
 def test_norm_clip(createAIAMap):
     # Tests that the default normalizer has clipping disabled
     assert createAIAMap.plot_settings['norm'].clip == False
+
+
+def test_norm_not_shared(createAIAMap):
+    """Tests that each AIAMap gets its own normalizer."""
+    aiamap = createAIAMap._new_instance(createAIAMap.data, createAIAMap.meta.copy())
+    assert aiamap.plot_settings['norm'] is not createAIAMap.plot_settings['norm']
@@ -3,13 +3,11 @@ This module provies NOAA Solar Cycle `~sunpy.timeseries.TimeSeries` source.
 """
 from collections import OrderedDict
 
-import numpy as np
 import matplotlib as mpl
 import matplotlib.pyplot as plt
 from pandas.io.parsers import read_csv
 
 import astropy.units as u
-from astropy.time import Time
 
 from sunpy.timeseries.timeseriesbase import GenericTimeSeries
 from sunpy.util.metadata import MetaDict
@@ -18,6 +16,26 @@ from sunpy.visualization import peek_show
 __all__ = ['NOAAIndicesTimeSeries', 'NOAAPredictIndicesTimeSeries']
 
 
+def _read_noaa_csv(fp, fields):
+    """
+    Reads the whitespace delimited table of a NOAA indices file.
+
+    The year and month columns are kept as strings for `_month_index`.
+    """
+    return read_csv(fp, sep=r'\s+', names=fields, comment='#',
+                    dtype={'yyyy': str, 'mm': str}, engine='c', low_memory=False)
+
+
+def _month_index(years, months):
+    """
+    Builds a ``datetime64[ns]`` array for the start of each month from the year
+    and month string columns of a NOAA indices table.
+    """
+    time = (years.to_numpy(dtype='U4').astype('datetime64[Y]') +
+            (months.to_numpy(dtype='U2').astype(int) - 1).astype('timedelta64[M]'))
+    return time.astype('datetime64[ns]')
+
+
 class NOAAIndicesTimeSeries(GenericTimeSeries):
     """
     NOAA Solar Cycle monthly indices.
@@ -50,6 +68,12 @@ class NOAAIndicesTimeSeries(GenericTimeSeries):
     """
     # Class attribute used to specify the source class of the TimeSeries.
     _source = 'noaaindices'
+    # The columns plotted and the y-axis label for each type of peek plot.
+    _peek_specs = {'sunspot SWO': (('sunspot SWO', 'sunspot SWO smooth'), 'Sunspot Number'),
+                   'sunspot RI': (('sunspot RI', 'sunspot RI smooth'), 'Sunspot Number'),
+                   'sunspot compare': (('sunspot RI', 'sunspot SWO'), 'Sunspot Number'),
+                   'radio': (('radio flux', 'radio flux smooth'), 'Radio Flux [sfu]'),
+                   'geo': (('geomagnetic ap', 'geomagnetic smooth'), 'Geomagnetic AP Index')}
 
     @peek_show
     def peek(self, type='sunspot SWO'):
@@ -66,34 +90,21 @@ class NOAAIndicesTimeSeries(GenericTimeSeries):
         Parameters
         ----------
         type : `str`, optional
-            The type of plot required. Defaults to "sunspot SWO".
+            The type of plot required, one of "sunspot SWO", "sunspot RI",
+            "sunspot compare", "radio" or "geo". Defaults to "sunspot SWO".
         """
         # Check we have a timeseries valid for plotting
         self._validate_data_for_plotting()
 
-        figure = plt.figure()
-        axes = plt.gca()
-
-        if type == 'sunspot SWO':
-            axes = self.data['sunspot SWO'].plot()
-            self.data['sunspot SWO smooth'].plot()
-            axes.set_ylabel('Sunspot Number')
-        if type == 'sunspot RI':
-            axes = self.data['sunspot RI'].plot()
-            self.data['sunspot RI smooth'].plot()
-            axes.set_ylabel('Sunspot Number')
-        if type == 'sunspot compare':
-            axes = self.data['sunspot RI'].plot()
-            self.data['sunspot SWO'].plot()
-            axes.set_ylabel('Sunspot Number')
-        if type == 'radio':
-            axes = self.data['radio flux'].plot()
-            self.data['radio flux smooth'].plot()
-            axes.set_ylabel('Radio Flux [sfu]')
-        if type == 'geo':
-            axes = self.data['geomagnetic ap'].plot()
-            self.data['geomagnetic ap smooth'].plot()
-            axes.set_ylabel('Geomagnetic AP Index')
+        if type not in self._peek_specs:
+            raise ValueError(f"Got unknown plot type '{type}', expected one of {list(self._peek_specs)}.")
+        columns, ylabel = self._peek_specs[type]
+
+        figure, axes = plt.subplots()
+
+        for column in columns:
+            self.data[column].plot(ax=axes)
+        axes.set_ylabel(ylabel)
 
         axes.set_ylim(0)
         axes.set_title('Solar Cycle Progression')
@@ -114,24 +125,24 @@ class NOAAIndicesTimeSeries(GenericTimeSeries):
         filepath : `str`
             The path to the file you want to parse.
         """
-        header = []
+        header_lines = []
         with open(filepath, 'r') as fp:
+            data_start = fp.tell()
             line = fp.readline()
             # Read header at top of file
             while line.startswith((":", "#")):
-                header += line
+                header_lines.append(line)
+                data_start = fp.tell()
                 line = fp.readline()
+            # Rewind to the first data line so it is not lost.
+            fp.seek(data_start)
             fields = ('yyyy', 'mm', 'sunspot SWO', 'sunspot RI', 'sunspot ratio', 'sunspot SWO smooth',
                       'sunspot RI smooth', 'radio flux', 'radio flux smooth', 'geomagnetic ap', 'geomagnetic smooth')
-            data = read_csv(fp, delim_whitespace=True, names=fields,
-                            comment='#', dtype={'yyyy': np.str, 'mm': np.str})
+            data = _read_noaa_csv(fp, fields)
             data = data.dropna(how='any')
-            timeindex = Time.strptime([x + y for x, y in zip(data['yyyy'], data['mm'])], '%Y%m')
-            timeindex.precision = 9
-            data['time'] = timeindex.isot.astype('datetime64')
+            data['time'] = _month_index(data['yyyy'], data['mm'])
             data = data.set_index('time')
-            data = data.drop('mm', 1)
-            data = data.drop('yyyy', 1)
+            data.drop(columns=['yyyy', 'mm'], inplace=True)
 
             # Add the units data
             units = OrderedDict([('sunspot SWO', u.dimensionless_unscaled),
@@ -144,16 +155,16 @@ class NOAAIndicesTimeSeries(GenericTimeSeries):
                                  ('geomagnetic ap', u.dimensionless_unscaled),
                                  ('geomagnetic smooth', u.dimensionless_unscaled)])
             # TODO: check units
-            # TODO: fix header/meta, it's returning rubbish.
-            return data, MetaDict({'comments': header}), units
+            return data, MetaDict({'comments': ''.join(header_lines)}), units
 
     @classmethod
     def is_datasource_for(cls, **kwargs):
         """
         Determines if header corresponds to an NOAA indices timeseries.
         """
-        if kwargs.get('source', ''):
-            return kwargs.get('source', '').lower().startswith(cls._source)
+        source = kwargs.get('source', '')
+        if source:
+            return source.lower().startswith(cls._source)
 
 
 class NOAAPredictIndicesTimeSeries(GenericTimeSeries):
@@ -210,12 +221,11 @@ class NOAAPredictIndicesTimeSeries(GenericTimeSeries):
         # Check we have a timeseries valid for plotting
         self._validate_data_for_plotting()
 
-        figure = plt.figure()
-        axes = plt.gca()
+        figure, axes = plt.subplots()
 
-        axes = self.data['sunspot'].plot(color='b')
-        self.data['sunspot low'].plot(linestyle='--', color='b')
-        self.data['sunspot high'].plot(linestyle='--', color='b')
+        self.data['sunspot'].plot(ax=axes, color='b')
+        self.data['sunspot low'].plot(ax=axes, linestyle='--', color='b')
+        self.data['sunspot high'].plot(ax=axes, linestyle='--', color='b')
 
         axes.set_ylim(0)
         axes.set_title('Solar Cycle Sunspot Number Prediction')
@@ -241,24 +251,24 @@ class NOAAPredictIndicesTimeSeries(GenericTimeSeries):
         """
         header = ''
         with open(filepath, 'r') as fp:
+            data_start = fp.tell()
             line = fp.readline()
             # Read header at top of file
             while line.startswith((":", "#")):
                 header += line
+                data_start = fp.tell()
                 line = fp.readline()
+            # Rewind to the first data line so it is not lost.
+            fp.seek(data_start)
             fields = ('yyyy', 'mm', 'sunspot', 'sunspot low', 'sunspot high',
                       'radio flux', 'radio flux low', 'radio flux high')
-            data = read_csv(filepath, delim_whitespace=True, names=fields,
-                            comment='#', skiprows=2, dtype={'yyyy': np.str, 'mm': np.str})
+            data = _read_noaa_csv(fp, fields)
             data = data.dropna(how='any')
 
-            timeindex = Time.strptime([x + y for x, y in zip(data['yyyy'], data['mm'])], '%Y%m')
-            timeindex.precision = 9
-            data['time'] = timeindex.isot.astype('datetime64')
+            data['time'] = _month_index(data['yyyy'], data['mm'])
 
             data = data.set_index('time')
-            data = data.drop('mm', 1)
-            data = data.drop('yyyy', 1)
+            data.drop(columns=['yyyy', 'mm'], inplace=True)
 
             # Add the units data
             units = OrderedDict([('sunspot', u.dimensionless_unscaled),
@@ -276,5 +286,6 @@ class NOAAPredictIndicesTimeSeries(GenericTimeSeries):
         Determines if header corresponds to an NOAA predict indices
         `~sunpy.timeseries.TimeSeries`.
         """
-        if kwargs.get('source', ''):
-            return kwargs.get('source', '').lower().startswith(cls._source)
+        source = kwargs.get('source', '')
+        if source:
+            return source.lower().startswith(cls._source)
@@ -172,11 +172,18 @@ class TestTimeSeries:
         # Test a NOAAPredictIndices TimeSeries
         ts_noaa_ind = sunpy.timeseries.TimeSeries(noaa_ind_filepath, source='NOAAIndices')
         assert isinstance(ts_noaa_ind, sunpy.timeseries.sources.noaa.NOAAIndicesTimeSeries)
+        comments = ts_noaa_ind.meta.metas[0]['comments']
+        assert isinstance(comments, str)
+        assert comments.startswith(':Recent_Solar_Indices:')
+        # The first data line of the file is 1991 01
+        assert ts_noaa_ind.data.index[0] == datetime.datetime(1991, 1, 1)
 
     def test_noaa_pre(self):
         # Test a NOAAIndices TimeSeries
         ts_noaa_pre = sunpy.timeseries.TimeSeries(noaa_pre_filepath, source='NOAAPredictIndices')
         assert isinstance(ts_noaa_pre, sunpy.timeseries.sources.noaa.NOAAPredictIndicesTimeSeries)
+        # The first data line of the file is 2015 07
+        assert ts_noaa_pre.data.index[0] == datetime.datetime(2015, 7, 1)
 
 # ==============================================================================
 # Remote Sources Tests
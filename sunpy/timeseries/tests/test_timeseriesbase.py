@@ -6,6 +6,7 @@ from collections import OrderedDict
 
 import numpy as np
 import pandas as pd
+import matplotlib.pyplot as plt
 import pytest
 from pandas import DataFrame
 from pandas.util.testing import assert_frame_equal
@@ -21,6 +22,7 @@ import sunpy.timeseries
 from sunpy.tests.helpers import figure_test
 from sunpy.time import TimeRange, parse_time
 from sunpy.timeseries import TimeSeriesMetaData
+from sunpy.timeseries.sources.noaa import NOAAIndicesTimeSeries
 from sunpy.util import SunpyUserWarning
 from sunpy.util.metadata import MetaDict
 
@@ -752,6 +754,21 @@ def test_noaa_ind_invalid_peek(noaa_ind_test_ts):
         empty_ts.peek()
 
 
+@pytest.mark.parametrize('peek_type', NOAAIndicesTimeSeries._peek_specs)
+def test_noaa_ind_peek_types(noaa_ind_test_ts, peek_type):
+    columns, ylabel = NOAAIndicesTimeSeries._peek_specs[peek_type]
+    noaa_ind_test_ts.peek(type=peek_type)
+    axes = plt.gca()
+    assert axes.get_ylabel() == ylabel
+    assert [line.get_label() for line in axes.get_lines()] == list(columns)
+    plt.close()
+
+
+def test_noaa_ind_invalid_peek_type(noaa_ind_test_ts):
+    with pytest.raises(ValueError, match='unknown plot type'):
+        noaa_ind_test_ts.peek(type='sunspot')
+
+
 def test_noaa_pre_invalid_peek(noaa_pre_test_ts):
     a = noaa_pre_test_ts.time_range.start - TimeDelta(2*u.day)
     b = noaa_pre_test_ts.time_range.start - TimeDelta(1*u.day)